@@ -1,129 +1,297 @@
 import numpy as np
 import matplotlib
 matplotlib.use('Agg')  # Use non-GUI backend for server
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_hex, to_rgb
+from matplotlib.figure import Figure
 import io
 import base64
-from flask import Flask, request, jsonify
+import functools
+import hashlib
+import logging
+import os
+import threading
+import time
+import uuid
+import multiprocessing
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from PIL import Image, ImageColor, ImageDraw
+from flask import Flask, request, jsonify, make_response, abort
 from flask_cors import CORS
+from flask_compress import Compress
+from flask.json.provider import JSONProvider
+# oxipng parallelizes with rayon across every core by default; each
+# gunicorn thread gets one instead of oversubscribing the CPU
+os.environ.setdefault('RAYON_NUM_THREADS', '1')
+try:
+    import oxipng  # Optional: lossless PNG recompression
+except ImportError:
+    oxipng = None
+try:
+    import orjson  # Optional: faster JSON for the large base64 responses
+except ImportError:
+    orjson = None
 import warnings
 warnings.filterwarnings('ignore')
 
 # Import the FIXED kolam algorithm
-from kolam_algorithm_fixed import KolamDraw, GenerateKolam
+from kolam_algorithm_fixed import (TraceKolam, DEFAULT_COLORS, BOUNDARY_TYPES,
+                                   theme_background, lap_pattern)
+
+# Request handling only logs at DEBUG (and exceptions), so the default
+# INFO level keeps the request path free of log I/O; LOG_LEVEL overrides
+logger = logging.getLogger('kolam')
+logging.basicConfig(level=logging.INFO)
+try:
+    logger.setLevel((os.environ.get('LOG_LEVEL') or 'INFO').upper())
+except ValueError:
+    logger.setLevel(logging.INFO)
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", os.environ['LOG_LEVEL'])
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson, used by jsonify and request.get_json
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes to the response without a str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
 
 app = Flask(__name__)
-CORS(app)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+CORS(app, expose_headers=['X-Path-Count', 'X-Is-One-Stroke', 'X-Generation-Time'])
+
+# Generate parameters fit in a few hundred bytes; Flask answers larger
+# bodies with 413 before they are read
+app.config['MAX_CONTENT_LENGTH'] = 4096
 
-def generate_kolam_base64(ND, sigmaref, boundary_type='diamond', theme='light', kolam_color=None, one_stroke=False):
+# Gzip JSON responses; the base64 image compresses well as text
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_LEVEL'] = 4
+Compress(app)
+
+# Rasterizer for kolam images: 'pillow' (default) or 'matplotlib'
+RENDERER = os.environ.get('KOLAM_RENDERER', 'pillow')
+
+# Output image width and height in pixels; most clients display kolams at
+# around 600px, larger sizes are for print
+DEFAULT_OUTPUT_SIZE = 600
+MIN_OUTPUT_SIZE = 100
+MAX_OUTPUT_SIZE = 2400
+
+# Lowercase names, for skipping .lower() on already-normalized input
+_BOUNDARY_NAMES = frozenset(BOUNDARY_TYPES)
+_THEME_NAMES = frozenset(('light', 'dark'))
+
+# Figures reused by the matplotlib renderer across requests, one per
+# thread since a Figure is not thread-safe. They are drawn through their
+# Agg canvas directly, bypassing pyplot.
+_FIG_LOCAL = threading.local()
+
+def _figure():
+    """
+    Return this thread's (figure, canvas, axes), creating them on first use
+    """
+    if not hasattr(_FIG_LOCAL, 'fig'):
+        fig = Figure(figsize=(12, 12), dpi=100)
+        _FIG_LOCAL.canvas = FigureCanvasAgg(fig)
+        _FIG_LOCAL.ax = fig.add_subplot(111)
+        fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
+        _FIG_LOCAL.fig = fig
+    return _FIG_LOCAL.fig, _FIG_LOCAL.canvas, _FIG_LOCAL.ax
+
+# Background rendering (KOLAM_ASYNC_RENDER=1): /api/generate_async queues
+# renders on a process pool and clients poll /api/result/<job_id>. Jobs
+# live in the memory of the worker that accepted them, and are dropped
+# JOB_TTL seconds after submission whether or not they were fetched.
+# Every gunicorn worker starts its own pool, so by default each gets an
+# equal share of the cores (WEB_CONCURRENCY is gunicorn's worker count);
+# RENDER_WORKERS overrides the per-worker pool size.
+ASYNC_RENDER = os.environ.get('KOLAM_ASYNC_RENDER') == '1'
+JOB_TTL = 600
+MAX_JOBS = 1000
+_POOL = None
+_POOL_LOCK = threading.Lock()
+_JOBS = {}  # job_id -> (future, pool, submit time), oldest first
+_JOBS_LOCK = threading.Lock()
+
+def render_kolam_png(ND, sigmaref, boundary_type='diamond', theme='light', kolam_color=None, one_stroke=False, seed=None, output_size=DEFAULT_OUTPUT_SIZE):
+    """
+    Generate kolam and return its PNG bytes with metadata
+
+    Seeded requests are deterministic and served from the render cache;
+    unseeded requests always draw a fresh random kolam.
+    """
+    if kolam_color is None:
+        kolam_color = DEFAULT_COLORS.get(boundary_type, '#1f77b4')
+
+    start = time.perf_counter()
+    render = _render_kolam if seed is not None else _render_kolam.__wrapped__
+    png, Ncx = render(ND, sigmaref, boundary_type, theme, kolam_color, one_stroke, seed, output_size)
+
+    meta = {
+        'path_count': Ncx,
+        'is_one_stroke': Ncx == 1,
+        'generation_time': round(time.perf_counter() - start, 3)
+    }
+    return png, meta
+
+def generate_kolam_base64(ND, sigmaref, boundary_type='diamond', theme='light', kolam_color=None, one_stroke=False, seed=None, output_size=DEFAULT_OUTPUT_SIZE):
     """
     Generate kolam and return as base64 encoded image
     """
     try:
-        # Set default colors based on boundary type
-        default_colors = {
-            'diamond': '#e377c2',
-            'corners': '#1f77b4', 
-            'fish': '#ff7f0e',
-            'waves': '#2ca02c',
-            'fractal': '#9467bd',
-            'organic': '#8c564b'
-        }
-
-        if kolam_color is None:
-            kolam_color = default_colors.get(boundary_type, '#1f77b4')
-
-        # Set theme colors
-        if theme.lower() == 'dark':
-            bg_color = '#1a1a1a'
-        else:
-            bg_color = 'white'
-
-        # Create KolamDraw instance
-        KD = KolamDraw(ND)
-        KD.set_boundary(boundary_type)  # This should work now!
-
-        if one_stroke:
-            # Use the one-stroke algorithm
-            # Parameters for one-stroke generation
-            Kp, Ki, ksh, Niter, Nthr = 0.01, 0.0001, 0.5, 80, 10
-            krRef = 1 - sigmaref
-
-            # Generate the gate matrix with more iterations for one-stroke
-            A2, F2, A2max, isx, ithx, ismax, Flag1, Flag2, krx2 = KD.Dice(krRef, Kp, Ki, Nthr)
-
-            # Iterate until we get a single complete path
-            max_attempts = 200
-            for attempt in range(max_attempts):
-                Ncx = KD.PathCount()
-                Nx2x = int((ND + 1) / 2)
-                Ncx, GM, GF = KD.IterFlipTestSwitch(ksh, Niter, 1, Nx2x)
-
-                # Check if we have one complete stroke
-                if Ncx == 1:
-                    break
-        else:
-            # Use regular generation
-            Kp, Ki, ksh, Niter, Nthr = 0.01, 0.0001, 0.5, 40, 10
-            krRef = 1 - sigmaref
-
-            A2, F2, A2max, isx, ithx, ismax, Flag1, Flag2, krx2 = KD.Dice(krRef, Kp, Ki, Nthr)
-            Ncx = KD.PathCount()
-            Nx2x = int((ND + 1) / 2)
-            Ncx, GM, GF = KD.IterFlipTestSwitch(ksh, Niter, 1, Nx2x)
-
-        # Generate the path
-        Ns = (2 * (ND ** 2) + 1) * 5
-        ijng, ne, ijngp = KD.XNextSteps(1, 1, 1, Ns)
-
-        # Create the plot
-        fig, ax = plt.subplots(figsize=(12, 12), facecolor=bg_color, dpi=100)
-        ax.set_facecolor(bg_color)
-
-        # Transform coordinates
-        ijngpx = (ijngp[:, 0] + ijngp[:, 1]) / 2
-        ijngpy = (ijngp[:, 0] - ijngp[:, 1]) / 2
-
-        # Plot the kolam
-        ax.plot(ijngpx[:-1], ijngpy[:-1], color=kolam_color, linewidth=2.5, alpha=0.95)
-
-        # Set axis properties
-        ND_plot = int(np.max(np.abs(ijngp))) + 2
-        ax.set_xlim(-ND_plot-1, ND_plot+1)
-        ax.set_ylim(-ND_plot-1, ND_plot+1)
-        ax.set_aspect('equal')
-        ax.axis('off')
-        plt.tight_layout()
-
-        # Convert to base64
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', facecolor=bg_color, 
-                   bbox_inches='tight', pad_inches=0.1)
-        img_buffer.seek(0)
-        img_base64 = base64.b64encode(img_buffer.read()).decode()
-        plt.close(fig)
+        png, meta = render_kolam_png(ND, sigmaref, boundary_type, theme,
+                                     kolam_color, one_stroke, seed, output_size)
+        encode = _png_data_url if seed is not None else _png_data_url.__wrapped__
 
         return {
             'success': True,
-            'image': f'data:image/png;base64,{img_base64}',
-            'path_count': Ncx,
-            'is_one_stroke': Ncx == 1
+            'image': encode(png),
+            **meta
         }
 
     except Exception as e:
+        logger.exception("Kolam generation failed")
         return {
             'success': False,
             'error': str(e)
         }
 
-@app.route('/api/generate', methods=['POST'])
-def generate():
+@functools.lru_cache(maxsize=512)
+def _png_data_url(png):
     """
-    API endpoint to generate kolam patterns
+    Encode PNG bytes as a base64 data URL
+
+    Only cached renders go through the cache: they hand back the same
+    bytes object on every hit, whose hash CPython keeps after the first
+    lookup.
+    """
+    img_base64 = base64.b64encode(png).decode('ascii')
+    return f'data:image/png;base64,{img_base64}'
+
+@functools.lru_cache(maxsize=512)
+def _render_kolam(ND, sigmaref, boundary_type, theme, kolam_color, one_stroke, seed, output_size):
+    """
+    Render a kolam and return its PNG bytes and path count
+    """
+    bg_color = theme_background(theme)
+    GM, Ncx, ijng, ne, ijngp = TraceKolam(ND, sigmaref, boundary_type, one_stroke, seed)
+
+    # First lap only, rotated into plot coordinates, with its extent
+    pattern_xy, max_abs = lap_pattern(ijng, ne, ijngp)
+    lim = int(max_abs) + 3
+
+    # Render and convert to base64
+    if RENDERER == 'matplotlib':
+        png = render_matplotlib_png(pattern_xy, kolam_color, bg_color, lim, output_size)
+    else:
+        png = render_paletted_png(pattern_xy, kolam_color, bg_color, lim, output_size)
+    # oxipng costs more than the render itself; only cached renders,
+    # encoded once and served many times, are worth recompressing
+    if seed is not None:
+        png = optimize_png(png)
+
+    return png, Ncx
+
+@functools.lru_cache(maxsize=256)
+def rgb(color):
+    """
+    Parse a hex or named color to an (r, g, b) tuple, caching the result
+    """
+    return ImageColor.getrgb(color)[:3]
+
+def render_paletted_png(pattern_xy, color_hex, bg_hex, lim, size=DEFAULT_OUTPUT_SIZE):
+    """
+    Draw the kolam path on a two-color paletted canvas and return PNG bytes
+
+    pattern_xy holds plot coordinates in [-lim, lim] on both axes.
+    """
+    img = Image.new('P', (size, size), 0)
+    img.putpalette([*rgb(bg_hex), *rgb(color_hex)] + [0] * (768 - 6))
+
+    # Map plot coordinates to pixels, flipping y so that up stays up
+    scale = (size - 1) / (2 * lim)
+    coords = ((pattern_xy * (1, -1) + lim) * scale).astype(np.int32)
+    width = max(1, round(3 * size / 800))
+    ImageDraw.Draw(img).line(coords.ravel().tolist(), fill=1, width=width)
+
+    # Two colors fit in 1 bit per pixel, an eighth of the data to deflate
+    img_buffer = io.BytesIO()
+    img.save(img_buffer, format='PNG', optimize=False, bits=1)
+    return img_buffer.getvalue()
+
+def render_matplotlib_png(pattern_xy, kolam_color, bg_color, lim, size=DEFAULT_OUTPUT_SIZE):
+    """
+    Plot the kolam path with matplotlib and return PNG bytes
+
+    Slower than render_paletted_png but anti-aliased. Reuses the calling
+    thread's figure, so concurrent renders do not block each other.
+    """
+    # Pre-blend the line against the background instead of drawing it
+    # with alpha, so Agg writes opaque pixels
+    line_rgb = 0.95 * np.asarray(to_rgb(kolam_color)) + 0.05 * np.asarray(to_rgb(bg_color))
+
+    fig, canvas, ax = _figure()
+    ax.clear()
+    fig.set_size_inches(size / fig.dpi, size / fig.dpi)
+    fig.set_facecolor(bg_color)
+    ax.set_facecolor(bg_color)
+
+    # Plot the kolam
+    ax.plot(pattern_xy[:, 0], pattern_xy[:, 1], color=line_rgb, linewidth=2.5 * size / 1200)
+
+    # Set axis properties (cleared along with the previous plot)
+    ax.set_xlim(-lim, lim)
+    ax.set_ylim(-lim, lim)
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    # Quantize straight from Agg's uint8 RGBA buffer; the image only
+    # holds two colors plus their anti-aliasing shades
+    canvas.draw()
+    img = Image.frombuffer('RGBA', canvas.get_width_height(), canvas.buffer_rgba(),
+                           'raw', 'RGBA', 0, 1)
+    img = img.convert('P', palette=Image.Palette.ADAPTIVE, colors=16)
+
+    img_buffer = io.BytesIO()
+    img.save(img_buffer, format='PNG', optimize=False, compress_level=1)
+    return img_buffer.getvalue()
+
+def optimize_png(png):
+    """
+    Losslessly shrink PNG bytes with oxipng, if it is installed
+
+    Falls back to the original bytes so a bad PNG never fails a request.
     """
+    if oxipng is None:
+        return png
     try:
-        data = request.get_json()
+        return oxipng.optimize_from_memory(png, level=2, strip=oxipng.StripChunks.safe())
+    except oxipng.PngError:
+        return png
 
+def validate_generate_params(data):
+    """
+    Extract and validate kolam parameters from a request body
+
+    Returns (params, None), or (None, error) with a client-facing message
+    for invalid input. Range checks return directly instead of raising,
+    so only malformed values go through exception handling.
+    """
+    if not isinstance(data, dict):
+        return None, 'Request body must be a JSON object'
+
+    try:
         # Extract parameters
         ND = int(data.get('ND', 19))
         sigmaref = float(data.get('sigmaref', 0.65))
@@ -131,31 +299,275 @@ def generate():
         theme = data.get('theme', 'light')
         kolam_color = data.get('kolam_color', None)
         one_stroke = bool(data.get('one_stroke', False))
+        seed = data.get('seed', None)
+        output_size = int(data.get('output_size', DEFAULT_OUTPUT_SIZE))
+
+        # Normalize so equivalent requests share a render cache entry
+        if boundary_type not in _BOUNDARY_NAMES:
+            boundary_type = boundary_type.lower()
+        if theme not in _THEME_NAMES:
+            theme = theme.lower()
+        if kolam_color is not None:
+            kolam_color = to_hex(kolam_color)
+        if seed is not None:
+            seed = int(seed)
+    except (TypeError, ValueError, AttributeError, OverflowError) as e:
+        return None, str(e)
+
+    # Validate parameters
+    if ND % 2 == 0:
+        return None, 'ND must be odd'
+    if ND < 5:
+        return None, 'ND must be >= 5'
+    if not 0 <= sigmaref <= 1:
+        return None, 'sigmaref must be between 0 and 1'
+    if not MIN_OUTPUT_SIZE <= output_size <= MAX_OUTPUT_SIZE:
+        return None, f'output_size must be between {MIN_OUTPUT_SIZE} and {MAX_OUTPUT_SIZE}'
+
+    return {
+        'ND': ND,
+        'sigmaref': sigmaref,
+        'boundary_type': boundary_type,
+        'theme': theme,
+        'kolam_color': kolam_color,
+        'one_stroke': one_stroke,
+        'seed': seed,
+        'output_size': output_size
+    }, None
+
+def generate_etag(params, representation):
+    """
+    ETag for a seeded kolam request, or None for an unseeded one
+
+    Only seeded requests are reproducible; unseeded ones must draw a new
+    kolam every time, so they are never revalidated. representation
+    ('json' or 'png') keeps the two endpoints' tags apart.
+    """
+    if params['seed'] is None:
+        return None
+    key = repr((representation, RENDERER, sorted(params.items()))).encode()
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+def not_modified(etag, weak=False):
+    """
+    Empty 304 response when the client already holds this ETag, else None
 
-        # Validate parameters
-        if ND % 2 == 0:
-            return jsonify({'success': False, 'error': 'ND must be odd'})
-        if ND < 5:
-            return jsonify({'success': False, 'error': 'ND must be >= 5'})
-        if not 0 <= sigmaref <= 1:
-            return jsonify({'success': False, 'error': 'sigmaref must be between 0 and 1'})
+    If-None-Match always compares weakly, so either form of a tag matches.
+    Depending on its version, Flask-Compress rewrites the tag of a
+    compressed response (weak ones too) to "<etag>:<encoding>", so any
+    such suffix is ignored; our own tags are hex and never contain ':'.
+    """
+    if etag is None:
+        return None
+    tags = request.if_none_match
+    if not (tags.star_tag or
+            any(tag.split(':', 1)[0] == etag for tag in tags.as_set(include_weak=True))):
+        return None
+    resp = make_response('', 304)
+    resp.set_etag(etag, weak=weak)
+    return resp
+
+@app.route('/api/generate', methods=['POST'])
+def generate():
+    """
+    API endpoint to generate kolam patterns
+    """
+    data = request.get_json(silent=True, cache=False)
+    params, error = validate_generate_params(data)
+    if error is not None:
+        return jsonify({'success': False, 'error': error})
+    logger.debug("Generate request: %s", params)
+
+    try:
+        # The client already holds this exact kolam. The tag is weak: the
+        # kolam is the same, but generation_time differs between bodies
+        etag = generate_etag(params, 'json')
+        resp = not_modified(etag, weak=True)
+        if resp is not None:
+            return resp
 
         # Generate kolam
-        result = generate_kolam_base64(ND, sigmaref, boundary_type, 
-                                     theme, kolam_color, one_stroke)
+        result = generate_kolam_base64(**params)
 
-        return jsonify(result)
+        resp = jsonify(result)
+        if etag is not None and result['success']:
+            resp.set_etag(etag, weak=True)
+            resp.headers['Cache-Control'] = 'public, max-age=3600'
+        return resp
 
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
+@app.route('/api/generate.png', methods=['POST'])
+def generate_png():
+    """
+    API endpoint returning the kolam as a raw PNG image
+
+    Takes the same parameters as /api/generate. Metadata is returned in
+    the X-Path-Count, X-Is-One-Stroke and X-Generation-Time headers.
+    """
+    data = request.get_json(silent=True, cache=False)
+    params, error = validate_generate_params(data)
+    if error is not None:
+        return jsonify({'success': False, 'error': error}), 400
+    logger.debug("PNG generate request: %s", params)
+
+    # Seeded PNG bodies are byte-identical, so this tag is strong
+    etag = generate_etag(params, 'png')
+    resp = not_modified(etag)
+    if resp is not None:
+        return resp
+
+    try:
+        png, meta = render_kolam_png(**params)
+    except Exception as e:
+        logger.exception("Kolam generation failed")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+    resp = make_response(png)
+    resp.headers['Content-Type'] = 'image/png'
+    resp.headers['X-Path-Count'] = str(meta['path_count'])
+    resp.headers['X-Is-One-Stroke'] = str(meta['is_one_stroke']).lower()
+    resp.headers['X-Generation-Time'] = str(meta['generation_time'])
+    if etag is not None:
+        resp.set_etag(etag)
+        resp.headers['Cache-Control'] = 'public, max-age=3600'
+    return resp
+
+def _render_pool():
+    """
+    Start the render process pool on first use (after any fork)
+
+    Workers are spawned, not forked: by the time the pool starts this
+    process may already run oxipng's and numba's thread pools, and a
+    forked copy of those can deadlock.
+    """
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            web_workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+            default = max(1, os.cpu_count() // web_workers)
+            workers = int(os.environ.get('RENDER_WORKERS', default))
+            _POOL = ProcessPoolExecutor(max_workers=workers,
+                                        mp_context=multiprocessing.get_context('spawn'))
+    return _POOL
+
+def _discard_pool(pool):
+    """Forget a broken pool so the next submit starts a fresh one"""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is pool:
+            _POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _prune_jobs(now):
+    """Drop jobs older than JOB_TTL; call with _JOBS_LOCK held"""
+    while _JOBS:
+        job_id = next(iter(_JOBS))
+        future, pool, submitted = _JOBS[job_id]
+        if now - submitted < JOB_TTL:
+            break
+        if future is not None:
+            future.cancel()
+        del _JOBS[job_id]
+
+@app.route('/api/generate_async', methods=['POST'])
+def generate_async():
+    """
+    API endpoint queueing a kolam render in the background
+
+    Returns 202 with a job_id to poll at /api/result/<job_id>.
+    """
+    if not ASYNC_RENDER:
+        abort(404)
+
+    data = request.get_json(silent=True, cache=False)
+    params, error = validate_generate_params(data)
+    if error is not None:
+        return jsonify({'success': False, 'error': error}), 400
+
+    # Reserve the slot under the same lock as the MAX_JOBS check, so
+    # concurrent submits cannot overshoot it; the future is filled in below
+    job_id = uuid.uuid4().hex
+    now = time.monotonic()
+    with _JOBS_LOCK:
+        _prune_jobs(now)
+        if len(_JOBS) >= MAX_JOBS:
+            return jsonify({'success': False, 'error': 'Too many pending jobs'}), 503
+        _JOBS[job_id] = (None, None, now)
+
+    # A pool broken by a crashed worker is replaced once
+    for attempt in range(2):
+        pool = _render_pool()
+        try:
+            future = pool.submit(generate_kolam_base64, **params)
+            break
+        except BrokenProcessPool:
+            logger.exception("Render pool broke")
+            _discard_pool(pool)
+    else:
+        with _JOBS_LOCK:
+            _JOBS.pop(job_id, None)
+        return jsonify({'success': False, 'error': 'Render pool unavailable'}), 503
+
+    with _JOBS_LOCK:
+        # Unless it already expired while submitting
+        if job_id in _JOBS:
+            _JOBS[job_id] = (future, pool, now)
+    return jsonify({'success': True, 'job_id': job_id}), 202
+
+@app.route('/api/result/<job_id>', methods=['GET'])
+def generate_result(job_id):
+    """
+    API endpoint polling a background render
+
+    Returns 202 while the render is pending, then the /api/generate
+    response once. Finished jobs are forgotten after they are fetched.
+    """
+    if not ASYNC_RENDER:
+        abort(404)
+
+    with _JOBS_LOCK:
+        _prune_jobs(time.monotonic())
+        job = _JOBS.get(job_id)
+        if job is not None and job[0] is not None and job[0].done():
+            del _JOBS[job_id]
+    if job is None:
+        return jsonify({'success': False, 'error': 'Unknown job_id'}), 404
+    future, pool, submitted = job
+    if future is None or not future.done():
+        return jsonify({'success': True, 'status': 'pending'}), 202
+
+    try:
+        return jsonify(future.result())
+    except BrokenProcessPool as e:
+        # A worker died; later jobs need a new pool. Only the pool that ran
+        # this job is discarded, never a fresh one serving other clients.
+        logger.exception("Render pool broke")
+        _discard_pool(pool)
+        return jsonify({'success': False, 'error': str(e) or 'Render worker crashed'}), 500
+    except CancelledError:
+        return jsonify({'success': False, 'error': 'Render was cancelled'}), 500
+    except Exception as e:
+        logger.exception("Background render failed")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+# The health response never changes, so its body is serialized once
+_HEALTH_BODY = app.json.dumps({'status': 'healthy'})
+
 @app.route('/api/health', methods=['GET'])
 def health():
-    return jsonify({'status': 'healthy'})
+    return app.response_class(_HEALTH_BODY, mimetype='application/json')
+
+@app.route('/api/cache_stats', methods=['GET'])
+def cache_stats():
+    return jsonify(_render_kolam.cache_info()._asdict())
 
 if __name__ == '__main__':
-    print("🎨 Starting Kolam Generator Backend...")
-    print("📡 API will be available at: http://localhost:5000")
-    print("🔗 Health check: http://localhost:5000/api/health")
-    print("🎯 Generate endpoint: http://localhost:5000/api/generate")
+    logger.info("🎨 Starting Kolam Generator Backend...")
+    logger.info("📡 API will be available at: http://localhost:5000")
+    logger.info("🔗 Health check: http://localhost:5000/api/health")
+    logger.info("📊 Cache stats: http://localhost:5000/api/cache_stats")
+    logger.info("🎯 Generate endpoint: http://localhost:5000/api/generate")
+    logger.info("🖼️ PNG endpoint: http://localhost:5000/api/generate.png")
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -1,7 +1,79 @@
+import functools
+import random
+from types import MappingProxyType
 import numpy as np
 import matplotlib.pyplot as plt
 import warnings
 warnings.filterwarnings('ignore')
+try:
+    from numba import njit  # Optional: compiles the path walk
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+@njit(cache=True)
+def _next_step(A, ND, icg, jcg, ce):
+    """Path evolution rule for one step; see KolamDraw.NextStep."""
+    icgx = icg + ND
+    jcx = jcg + ND
+    icgx2 = icgx // 2
+    jcx2 = jcx // 2
+
+    calpha = ce % 2
+    cbeta = -1 if ce > 1 else 1
+    cgamma = -1 if (icgx + jcx) % 4 == 0 else 1
+    cg = 1 if A[icgx2, jcx2] > 0.5 else 0
+
+    cgd = 1 - cg
+    calphad = 1 - calpha
+    nalpha = cg * calpha + cgd * calphad
+    nbeta = (cg + cgd * cgamma) * cbeta
+    nh = (calphad * cgamma * cgd + calpha * cg) * cbeta
+    nv = (calpha * cgamma * cgd + calphad * cg) * cbeta
+
+    ing = icg + nh * 2
+    jng = jcg + nv * 2
+    ingp = icg + cgd * (calphad * cgamma - calpha) * cbeta * 0.5
+    jngp = jcg + cgd * (calpha * cgamma - calphad) * cbeta * 0.5
+
+    ne = 0 if nalpha == 0 and nbeta == 1 else (2 if nalpha == 0 else (1 if nbeta == 1 else 3))
+    return ing, jng, ne, ingp, jngp
+
+
+@njit(cache=True)
+def _trace(A, ND, icgo, jcgo, ceo, Ns):
+    """Walk Ns - 1 steps from a start state, recording every state."""
+    ijcx = np.zeros((Ns, 2))
+    cex = np.zeros(Ns)
+    ijcp = np.zeros((Ns, 2))
+    ijcx[0, 0] = icgo
+    ijcx[0, 1] = jcgo
+    cex[0] = ceo
+
+    icg, jcg, ce = icgo, jcgo, ceo
+    for i in range(Ns - 1):
+        icg, jcg, ce, ijcp[i, 0], ijcp[i, 1] = _next_step(A, ND, icg, jcg, ce)
+        ijcx[i + 1, 0] = icg
+        ijcx[i + 1, 1] = jcg
+        cex[i + 1] = ce
+    return ijcx, cex, ijcp
+
+
+@njit(cache=True)
+def _closure_length(A, ND, icgo, jcgo, ceo, Ns):
+    """
+    Number of steps until the walk returns to its start state.
+
+    Gives up after Ns - 2 steps and returns 0. Only the current state is
+    kept, so nothing is allocated.
+    """
+    icg, jcg, ce = icgo, jcgo, ceo
+    for isa in range(1, Ns - 1):
+        icg, jcg, ce, ingp, jngp = _next_step(A, ND, icg, jcg, ce)
+        if icg == icgo and jcg == jcgo and ce == ceo:
+            return isa
+    return 0
 
 
 class KolamDraw(object):
@@ -13,9 +85,16 @@ class KolamDraw(object):
     to ensure balanced and aesthetically pleasing patterns.
     """
 
-    def __init__(self, ND):
-        """Initialize kolam drawer with grid dimension."""
+    def __init__(self, ND, seed=None):
+        """
+        Initialize kolam drawer with grid dimension.
+
+        Each drawer has its own random state, so concurrent drawers never
+        share one. Give a seed to make the generated kolam reproducible;
+        otherwise the state is seeded from the OS.
+        """
         self.ND = ND
+        self.rng = random.Random(seed)
         self.Nx = ND + 1
         self.A1 = np.ones((self.Nx, self.Nx)) * 99
         self.F1 = np.ones((self.Nx, self.Nx))
@@ -35,47 +114,24 @@ class KolamDraw(object):
         """
         Determine if a given grid point lies within the active boundary.
 
-        This method implements different geometric constraints based on
-        the selected boundary type, allowing for diverse pattern shapes.
+        Different boundary types impose different geometric constraints,
+        allowing for diverse pattern shapes (see BoundaryMask).
+        """
+        return bool(boundary_mask(self.ND, self.boundary_type)[i, j])
+
+    def BoundaryMask(self):
+        """
+        Evaluate the boundary constraint over the whole gate grid at once.
+
+        Each boundary type maps to a vectorized predicate over the grid
+        offsets, so the mask is computed in a few NumPy operations instead
+        of a per-point branch.
         """
-        ND = self.ND
-        x = i - ND
-        y = j - ND
-
-        if self.boundary_type == 'diamond':
-            return True
-
-        elif self.boundary_type == 'corners':
-            threshold = ND * 0.3
-            return (abs(x) >= threshold) and (abs(y) >= threshold)
-
-        elif self.boundary_type == 'fish':
-            # Fish pattern: concentric rings (bullseye)
-            dist = np.sqrt(x**2 + y**2)
-            ring_width = ND * 0.35
-            ring_num = int(dist / ring_width)
-            return (ring_num % 2) == 0
-
-        elif self.boundary_type == 'waves':
-            freq = 2 * np.pi / (ND * 0.6)
-            wave1 = np.sin(x * freq)
-            wave2 = np.sin(y * freq)
-            interference = wave1 + wave2
-            return interference > 0
-
-        elif self.boundary_type == 'fractal':
-            xi = int(abs(x) + ND)
-            yi = int(abs(y) + ND)
-            return (xi & yi) % 4 < 2
-
-        elif self.boundary_type == 'organic':
-            dist = np.sqrt(x**2 + y**2)
-            angle = np.arctan2(y, x)
-            wobble = np.sin(angle * 3) * ND * 0.2
-            max_dist = ND * 0.8 + wobble
-            return dist < max_dist
-
-        return True
+        i, j = np.indices((self.Nx, self.Nx))
+        inside = _BOUNDARY_PREDICATES.get(self.boundary_type)
+        if inside is None:
+            return np.ones((self.Nx, self.Nx), dtype=bool)
+        return inside(i - self.ND, j - self.ND, self.ND)
 
     def ResetGateMatrix(self):
         """
@@ -85,7 +141,7 @@ class KolamDraw(object):
         boundary values and diagonal constraints. Applies the selected
         boundary mask to restrict pattern generation to valid regions.
         """
-        Nx2 = int(self.Nx / 2)
+        Nx2 = self.Nx // 2
         Nx1 = self.Nx - 1
         A = self.A1 * 1
         F = self.F1 * 1
@@ -102,17 +158,15 @@ class KolamDraw(object):
 
         # Apply custom boundary constraints
         if self.boundary_type != 'diamond':
-            for i in range(self.Nx):
-                for j in range(self.Nx):
-                    if not self.is_inside_boundary(i, j):
-                        A[i, j] = 0
-                        F[i, j] = 0
+            outside = ~boundary_mask(self.ND, self.boundary_type)
+            A[outside] = 0
+            F[outside] = 0
 
         return A, F
 
     def toss(self, bias):
         """Generate a random binary value with specified bias."""
-        x = np.random.randint(0, 1000) / 1000
+        x = self.rng.randrange(1000) / 1000
         return 1 if x > bias else 0
 
     def AssignGates(self, krRef, Kp, Ki):
@@ -128,7 +182,7 @@ class KolamDraw(object):
         count1 = 0
         count01 = 1
         Nx1 = self.Nx - 1
-        Nx2 = int(self.Nx / 2)
+        Nx2 = self.Nx // 2
 
         for i in range(1, Nx2):
             for j in range(i, self.Nx - i):
@@ -185,44 +239,12 @@ class KolamDraw(object):
         moves from one position to the next, considering the gate values
         and current direction.
         """
-        icgx = icg + self.ND
-        jcx = jcg + self.ND
-        icgx2 = int(np.floor(icgx / 2))
-        jcx2 = int(np.floor(jcx / 2))
-
-        calpha = np.mod(ce, 2)
-        cbeta = -1 if ce > 1 else 1
-        cgamma = -1 if np.mod(int(icgx + jcx), 4) == 0 else 1
-        cg = 1 if self.A[icgx2, jcx2] > 0.5 else 0
-
-        cgd = 1 - cg
-        calphad = 1 - calpha
-        nalpha = cg * calpha + cgd * calphad
-        nbeta = (cg + cgd * cgamma) * cbeta
-        nh = (calphad * cgamma * cgd + calpha * cg) * cbeta
-        nv = (calpha * cgamma * cgd + calphad * cg) * cbeta
-
-        ing = int(icg + nh * 2)
-        jng = int(jcg + nv * 2)
-        ingp = icg + cgd * (calphad * cgamma - calpha) * cbeta * 0.5
-        jngp = jcg + cgd * (calpha * cgamma - calphad) * cbeta * 0.5
-
-        ne = 0 if nalpha == 0 and nbeta == 1 else (2 if nalpha == 0 else (1 if nbeta == 1 else 3))
-        return ing, jng, ne, ingp, jngp
+        # Positions and directions are whole numbers
+        return _next_step(self.A, self.ND, int(icg), int(jcg), int(ce))
 
     def XNextSteps(self, icgo, jcgo, ceo, Ns):
         """Generate complete path sequence from starting position."""
-        ijcx = np.zeros((Ns, 2))
-        cex = np.zeros(Ns)
-        ijcp = np.zeros((Ns, 2))
-        ijcx[0, :] = [icgo, jcgo]
-        cex[0] = ceo
-
-        for i in range(Ns - 1):
-            ijcx[i + 1, 0], ijcx[i + 1, 1], cex[i + 1], ijcp[i, 0], ijcp[i, 1] = self.NextStep(
-                ijcx[i, 0], ijcx[i, 1], cex[i]
-            )
-        return ijcx, cex, ijcp
+        return _trace(self.A, self.ND, int(icgo), int(jcgo), int(ceo), Ns)
 
     def PathCount(self):
         """
@@ -232,23 +254,9 @@ class KolamDraw(object):
         the number of steps until the path closes (returns to start with
         same direction). This is used to verify one-stroke completion.
         """
-        Ns, isx, isa = self.Ns, 0, 0
-        ijcx = np.zeros((Ns, 2))
-        cex = np.zeros(Ns)
-        ijcp = np.zeros((Ns, 2))
-        ijcx[0, 0] = 2 * np.random.randint(0, 2) - 1
-        ijcx[0, 1] = 2 * np.random.randint(0, 2) - 1
-        cex[0] = 0
-
-        while isa < Ns - 2:
-            isa += 1
-            ijcx[isa, 0], ijcx[isa, 1], cex[isa], ijcp[isa - 1, 0], ijcp[isa - 1, 1] = self.NextStep(
-                ijcx[isa - 1, 0], ijcx[isa - 1, 1], cex[isa - 1]
-            )
-            if int(ijcx[isa, 0]) == int(ijcx[0, 0]) and int(ijcx[isa, 1]) == int(ijcx[0, 1]) and int(cex[isa]) == int(cex[0]):
-                isx = isa
-                break
-        return isx
+        icgo = 2 * self.rng.randrange(2) - 1
+        jcgo = 2 * self.rng.randrange(2) - 1
+        return _closure_length(self.A, self.ND, icgo, jcgo, 0, self.Ns)
 
     def Dice(self, krRef, Kp, Ki, Nthr):
         """
@@ -259,24 +267,14 @@ class KolamDraw(object):
         one-stroke path.
         """
         Ns, ith, ithx, ismax = self.Ns, 0, 0, 0
-        ijcx, cex, ijcp = np.zeros((Ns, 2)), np.zeros(Ns), np.zeros((Ns, 2))
         krx = np.zeros(Nthr)
         Amax = self.A1 * 1
 
         while ith < Nthr:
             self.A, self.F, krx[ith] = self.AssignGates(krRef, Kp, Ki)
-            Flag1 = Flag2 = isx = isa = 0
-            ijcx[0, 0] = ijcx[0, 1] = 1
-            cex[0] = 0
-
-            while isa < Ns - 2:
-                isa += 1
-                ijcx[isa, 0], ijcx[isa, 1], cex[isa], ijcp[isa - 1, 0], ijcp[isa - 1, 1] = self.NextStep(
-                    ijcx[isa - 1, 0], ijcx[isa - 1, 1], cex[isa - 1]
-                )
-                if int(ijcx[isa, 0]) == int(ijcx[0, 0]) and int(ijcx[isa, 1]) == int(ijcx[0, 1]) and int(cex[isa]) == int(cex[0]):
-                    Flag1, isx = 1, isa
-                    break
+            Flag2 = 0
+            isx = _closure_length(self.A, self.ND, 1, 1, 0, Ns)
+            Flag1 = 1 if isx > 0 else 0
 
             if Flag1 == 1:
                 if isx < Ns + 2:
@@ -312,13 +310,15 @@ class KolamDraw(object):
         improves the path length. Keeps beneficial changes and reverts
         detrimental ones.
         """
-        Ncx, Ns, Nx2 = self.PathCount(), self.Ns, int(self.Nx / 2)
+        Ncx, Ns, Nx2 = self.PathCount(), self.Ns, self.Nx // 2
         iLx, iHx = max(min(iL, Nx2), 1), max(min(iH, Nx2), max(min(iL, Nx2), 1))
 
         for ig in range(iLx, iHx):
             for jg in range(ig, self.Nx - 1 - ig):
-                Ax, Fx = self.A * 1, self.F * 1
                 if self.F[ig, jg] == 0 and self.toss(ksh) == 1:
+                    # SwitchGate works on copies, so the current matrices
+                    # can be kept by reference for the revert
+                    Ax, Fx = self.A, self.F
                     self.A, self.F, Flag = self.SwitchGate(ig, jg)
                     Nc = self.PathCount()
                     if Nc < Ncx:
@@ -346,6 +346,190 @@ class KolamDraw(object):
 
 
 
+def _inside_corners(x, y, ND):
+    threshold = ND * 0.3
+    return (np.abs(x) >= threshold) & (np.abs(y) >= threshold)
+
+
+def _inside_fish(x, y, ND):
+    # Fish pattern: concentric rings (bullseye)
+    dist = np.sqrt(x**2 + y**2)
+    ring_num = (dist / (ND * 0.35)).astype(int)
+    return (ring_num % 2) == 0
+
+
+def _inside_waves(x, y, ND):
+    freq = 2 * np.pi / (ND * 0.6)
+    return np.sin(x * freq) + np.sin(y * freq) > 0
+
+
+def _inside_fractal(x, y, ND):
+    xi = np.abs(x) + ND
+    yi = np.abs(y) + ND
+    return (xi & yi) % 4 < 2
+
+
+def _inside_organic(x, y, ND):
+    dist = np.sqrt(x**2 + y**2)
+    angle = np.arctan2(y, x)
+    max_dist = ND * 0.8 + np.sin(angle * 3) * ND * 0.2
+    return dist < max_dist
+
+
+# Vectorized boundary predicates over grid offsets; 'diamond' (and any
+# unknown type) keeps the full grid
+_BOUNDARY_PREDICATES = {
+    'corners': _inside_corners,
+    'fish': _inside_fish,
+    'waves': _inside_waves,
+    'fractal': _inside_fractal,
+    'organic': _inside_organic
+}
+
+@njit(cache=True)
+def lap_pattern(ijng, ne, ijngp):
+    """
+    Plot coordinates and extent of the first lap of a traced path.
+
+    Once the walk returns to its starting state it retraces the same
+    loop, so points after the first closure are dropped (without a
+    closure, every point but the last is kept). In the same sweep the
+    drawn points are rotated 45 degrees into an (N, 2) array and the
+    largest absolute coordinate is tracked.
+
+    Returns
+    -------
+    tuple
+        (pattern_xy, max_abs)
+    """
+    N = ijngp.shape[0]
+    xy = np.empty((N, 2))
+    max_abs = 0.0
+    n = N - 1
+    for i in range(N):
+        closed = i > 0 and ijng[i, 0] == ijng[0, 0] and ijng[i, 1] == ijng[0, 1] and ne[i] == ne[0]
+        if i >= n and not closed:
+            break
+        x, y = ijngp[i, 0], ijngp[i, 1]
+        xy[i, 0] = (x + y) * 0.5
+        xy[i, 1] = (x - y) * 0.5
+        max_abs = max(max_abs, abs(x), abs(y))
+        if closed:
+            n = i + 1
+            break
+    return xy[:n], max_abs
+
+
+# Compile the path walk up front (or load it from numba's on-disk cache),
+# so the first request does not pay for it
+_closure_length(np.zeros((2, 2)), 1, 1, 1, 0, 3)
+_trace(np.zeros((2, 2)), 1, 1, 1, 0, 3)
+lap_pattern(*_trace(np.zeros((2, 2)), 1, 1, 1, 0, 3))
+
+BOUNDARY_TYPES = ('diamond', 'corners', 'fish', 'waves', 'fractal', 'organic')
+
+
+# Largest grid whose boundary masks are cached. Together with the fixed
+# set of boundary types this bounds the cache (well under 1 MB), so
+# client-chosen sizes or names can never evict or pin anything.
+MASK_CACHE_MAX_ND = 51
+
+
+def boundary_mask(ND, boundary_type):
+    """
+    Return the read-only boundary mask for a grid size and boundary type.
+
+    The mask depends only on (ND, boundary_type). Masks of known boundary
+    types up to MASK_CACHE_MAX_ND are computed once and cached; the usual
+    grid sizes are warmed at import. Anything else is computed per call.
+    """
+    if ND <= MASK_CACHE_MAX_ND and boundary_type in BOUNDARY_TYPES:
+        return _cached_boundary_mask(ND, boundary_type)
+    return _compute_boundary_mask(ND, boundary_type)
+
+
+def _compute_boundary_mask(ND, boundary_type):
+    KD = KolamDraw(ND)
+    KD.set_boundary(boundary_type)
+    mask = KD.BoundaryMask()
+    mask.setflags(write=False)
+    return mask
+
+
+_cached_boundary_mask = functools.lru_cache(maxsize=None)(_compute_boundary_mask)
+
+
+for _nd in range(5, 26, 2):
+    for _boundary in BOUNDARY_TYPES:
+        boundary_mask(_nd, _boundary)
+
+
+# Default kolam colors per boundary type (read-only)
+DEFAULT_COLORS = MappingProxyType({
+    'diamond': '#e377c2',
+    'corners': '#1f77b4',
+    'fish': '#ff7f0e',
+    'waves': '#2ca02c',
+    'fractal': '#9467bd',
+    'organic': '#8c564b'
+})
+
+
+def theme_background(theme):
+    """Return the background color for a visual theme ('light' or 'dark')."""
+    return '#1a1a1a' if theme.lower() == 'dark' else '#ffffff'
+
+
+def TraceKolam(ND, sigmaref, boundary_type='diamond', one_stroke=False, seed=None):
+    """
+    Search for a gate configuration and trace the resulting kolam path.
+
+    Parameters are as for GenerateKolam; one_stroke spends more flip
+    iterations chasing a single closed stroke, and seed makes the
+    result reproducible.
+
+    Returns
+    -------
+    tuple
+        Gate matrix, path length, and the XNextSteps path arrays
+        (positions, directions, drawn points)
+    """
+    KD = KolamDraw(ND, seed)
+    KD.set_boundary(boundary_type)
+
+    if one_stroke:
+        # Parameters for one-stroke generation
+        Kp, Ki, ksh, Niter, Nthr = 0.01, 0.0001, 0.5, 80, 10
+        krRef = 1 - sigmaref
+
+        # Generate the gate matrix with more iterations for one-stroke
+        A2, F2, A2max, isx, ithx, ismax, Flag1, Flag2, krx2 = KD.Dice(krRef, Kp, Ki, Nthr)
+
+        # Iterate until we get a single complete path
+        max_attempts = 200
+        for attempt in range(max_attempts):
+            Ncx = KD.PathCount()
+            Nx2x = (ND + 1) // 2
+            Ncx, GM, GF = KD.IterFlipTestSwitch(ksh, Niter, 1, Nx2x)
+
+            # Check if we have one complete stroke
+            if Ncx == 1:
+                break
+    else:
+        Kp, Ki, ksh, Niter, Nthr = 0.01, 0.0001, 0.5, 40, 10
+        krRef = 1 - sigmaref
+
+        A2, F2, A2max, isx, ithx, ismax, Flag1, Flag2, krx2 = KD.Dice(krRef, Kp, Ki, Nthr)
+        Ncx = KD.PathCount()
+        Nx2x = (ND + 1) // 2
+        Ncx, GM, GF = KD.IterFlipTestSwitch(ksh, Niter, 1, Nx2x)
+
+    # Generate the path
+    Ns = (2 * (ND ** 2) + 1) * 5
+    ijng, ne, ijngp = KD.XNextSteps(1, 1, 1, Ns)
+    return GM, Ncx, ijng, ne, ijngp
+
+
 def plotkolam(ijngp, kolam_color='#1f77b4', theme='light'):
     """
     Render the kolam pattern with specified visual theme.
@@ -353,10 +537,7 @@ def plotkolam(ijngp, kolam_color='#1f77b4', theme='light'):
     Creates a matplotlib figure displaying the kolam path with
     customizable colors and background theme (light or dark).
     """
-    if theme.lower() == 'dark':
-        bg_color = '#1a1a1a'
-    else:
-        bg_color = 'white'
+    bg_color = theme_background(theme)
 
     fig, ax = plt.subplots(figsize=(12, 12), facecolor=bg_color)
     ax.set_facecolor(bg_color)
@@ -366,18 +547,20 @@ def plotkolam(ijngp, kolam_color='#1f77b4', theme='light'):
 
     ax.plot(ijngpx[:-1], ijngpy[:-1], color=kolam_color, linewidth=2.5, alpha=0.95)
 
-    ND = int(np.max(np.abs(ijngp))) + 2
+    # Largest |coordinate| from the two extremes, without an abs() copy
+    ND = int(max(ijngp.max(), -ijngp.min())) + 2
     plt.axis('equal')
     plt.axis('off')
     plt.xlim(-ND-1, ND+1)
     plt.ylim(-ND-1, ND+1)
 
-    plt.tight_layout()
+    # Axes are off, so there is nothing for tight_layout to arrange
+    fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
     plt.show()
     return fig
 
 
-def GenerateKolam(ND, sigmaref, boundary_type='diamond', theme='light', kolam_color=None):
+def GenerateKolam(ND, sigmaref, boundary_type='diamond', theme='light', kolam_color=None, seed=None):
     """
     Main function to generate and display a kolam pattern.
 
@@ -395,47 +578,25 @@ def GenerateKolam(ND, sigmaref, boundary_type='diamond', theme='light', kolam_co
         Visual theme: 'light' or 'dark'
     kolam_color : str
         Path color (color name or hex code)
+    seed : int, optional
+        Seed for a reproducible kolam
 
     Returns
     -------
     tuple
         Gate matrix and path length
     """
-    default_colors = {
-        'diamond': '#e377c2',
-        'corners': '#1f77b4',
-        'fish': '#ff7f0e',
-        'waves': '#2ca02c',
-        'fractal': '#9467bd',
-        'organic': '#8c564b'
-    }
-
     if kolam_color is None:
-        kolam_color = default_colors.get(boundary_type, '#1f77b4')
+        kolam_color = DEFAULT_COLORS.get(boundary_type, '#1f77b4')
 
-    Kp, Ki, ksh, Niter, Nthr = 0.01, 0.0001, 0.5, 40, 10
-    krRef = 1 - sigmaref
-
-    KD = KolamDraw(ND)
-    KD.set_boundary(boundary_type)
-
-    A2, F2, A2max, isx, ithx, ismax, Flag1, Flag2, krx2 = KD.Dice(krRef, Kp, Ki, Nthr)
-
-    Ncx = KD.PathCount()
-    Nx2x = int((ND + 1) / 2)
-    Ncx, GM, GF = KD.IterFlipTestSwitch(ksh, Niter, 1, Nx2x)
-
-    Ns = (2 * (ND ** 2) + 1) * 5
-    ijng, ne, ijngp = KD.XNextSteps(1, 1, 1, Ns)
+    GM, Ncx, ijng, ne, ijngp = TraceKolam(ND, sigmaref, boundary_type, seed=seed)
 
     plotkolam(ijngp, kolam_color, theme)
     return GM, Ncx
 
 
 if __name__ == "__main__":
-    np.random.seed(42)
-
-    GenerateKolam(19, 0.65, 'fractal', theme='light', kolam_color='brown')
-    GenerateKolam(19, 0.65, 'waves', theme='dark', kolam_color='white')
-    GenerateKolam(19, 0.65, 'fish', theme='dark', kolam_color='cyan')
+    GenerateKolam(19, 0.65, 'fractal', theme='light', kolam_color='brown', seed=42)
+    GenerateKolam(19, 0.65, 'waves', theme='dark', kolam_color='white', seed=43)
+    GenerateKolam(19, 0.65, 'fish', theme='dark', kolam_color='cyan', seed=44)
 
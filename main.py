@@ -1,8 +1,10 @@
 # main.py - Railway entry point for Kolam Generator
-from backend import app
+from backend import app, logger
 import os
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
-    print(f"🚀 Starting Kolam Generator on port {port}")
-    app.run(host="0.0.0.0", port=port, debug=False)
\ No newline at end of file
+    logger.info("🚀 Starting Kolam Generator on port %d", port)
+    # Production runs under gunicorn (see Procfile); this is the fallback
+    from waitress import serve
+    serve(app, host="0.0.0.0", port=port, threads=8)
\ No newline at end of file